@@ -4,34 +4,93 @@
 # • Requires: `openai>=1.10.0`  ➜  `pip install openai requests pillow`
 # • Environment: set `OPENAI_API_KEY`
 # • Optional clipboard: `pip install pyperclip`
+# • Optional faster base64: `pip install pybase64`
 # • Icon: put `icon.ico` next to the script / EXE
 # -------------------------------------------------------------
 
-import base64
+import asyncio
 import csv
+import functools
+import hashlib
+import json
+import operator
 import os
+import queue
+import random
+import re
 import sys
+import tempfile
 import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from io import BytesIO
+from io import BytesIO, StringIO
 
 import requests
 from PIL import Image, ImageTk
 import openai  # core dependency
 
+try:
+    import pybase64 as _b64  # optional – SIMD-accelerated base64
+except ImportError:
+    import base64 as _b64
+
 try:
     import pyperclip  # optional – clipboard copy
 except ImportError:
     pyperclip = None
 
+
+def _env_int(name, default):
+    """Positive int from the environment; bad or missing values fall back to default."""
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except ValueError:
+        return default
+
 # --------------------------- OpenAI settings ---------------------------
 MODEL = "gpt-4o-mini"  # change to gpt-4o if your account has access
 PROMPT_IMAGE = (
     "You are given an image that contains tabular data. "
     "Identify sensible column names and extract the table. "
-    "Return ONLY raw CSV with a header row and subsequent data rows."
+    "Return a JSON object with the column names in \"headers\" and the data rows, "
+    "one array of cell strings per row, in \"rows\"."
 )
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "table",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "headers": {"type": "array", "items": {"type": "string"}},
+                "rows": {
+                    "type": "array",
+                    "items": {"type": "array", "items": {"type": "string"}},
+                },
+            },
+            "required": ["headers", "rows"],
+            "additionalProperties": False,
+        },
+    },
+}
+DETAIL = "low"  # vision detail level; "high" only when the user opts in
+MAX_IMAGE_SIDE = 1536  # longest edge sent to the API, in pixels
+JPEG_QUALITY = 85
+BATCH_CONCURRENCY = _env_int("EXTRACTOR_CONCURRENCY", 8)  # simultaneous batch requests
+BATCH_RETRIES = 5  # attempts per image on rate limits / timeouts
+BATCH_TIMEOUT = 120  # seconds per batch request attempt
+BATCH_MAX_DELAY = 60  # cap on a server-requested Retry-After, in seconds
+TABLE_DETACH_ROWS = 500  # bigger inserts are done with the table unmapped
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+# ----------------------------------------------------------------------
+
+# --------------------------- response cache ---------------------------
+_cache_dir = os.path.join(tempfile.gettempdir(), "extractor_cache")
+_cache_max = 32  # most recently used responses kept on disk
+_upload_cache: dict[str, str] = {}  # image content hash -> prepared data URL
+_upload_cache_max = 16
+_upload_lock = threading.Lock()
 # ----------------------------------------------------------------------
 
 # keep reference to the thumbnail so it isn't garbage‑collected
@@ -39,49 +98,259 @@ _thumbnail_ref = None
 
 # --------------------------- OpenAI helpers ---------------------------
 
-def send_to_openai(image_bytes: bytes) -> str:
-    """Send image bytes to GPT‑4o Vision and return raw CSV."""
-    b64 = base64.b64encode(image_bytes).decode()
-    resp = openai.chat.completions.create(
+@functools.lru_cache(maxsize=4)
+def _load(path, mtime):
+    """Decode an image once per (path, mtime), already reduced to MAX_IMAGE_SIDE.
+
+    Shared by the thumbnail and the payload, so Browse followed by Extract decodes once.
+    thumbnail() drafts JPEGs at a reduced scale; copy the result before modifying it.
+    """
+    with Image.open(path) as img:
+        img.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE), Image.LANCZOS)
+        img.load()  # thumbnail() is a no-op for small images; read them before the file closes
+    return img
+
+
+def _load_image(path):
+    return _load(path, os.path.getmtime(path))
+
+
+def _prepare_payload(img) -> bytes:
+    """Downscale a copy of the image and re-encode it as JPEG for upload."""
+    img = img.copy()
+    img.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE), Image.LANCZOS)
+    buf = BytesIO()
+    _flatten(img).save(buf, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    return buf.getvalue()
+
+
+def _flatten(img):
+    """Composite transparent images onto white – JPEG has no alpha channel."""
+    if img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        bg = Image.new("RGB", img.size, "white")
+        bg.paste(img, mask=img.getchannel("A"))
+        return bg
+    return img.convert("RGB")
+
+
+def _image_url(image_hash: str, img_path) -> str:
+    """Return the data URL for an image, reusing the encoded payload of earlier runs."""
+    with _upload_lock:
+        url = _upload_cache.get(image_hash)
+    if url is None:
+        b64 = _b64.b64encode(_prepare_payload(_load_image(img_path))).decode("ascii")
+        url = f"data:image/jpeg;base64,{b64}"
+        with _upload_lock:
+            _upload_cache[image_hash] = url
+            while len(_upload_cache) > _upload_cache_max:
+                del _upload_cache[next(iter(_upload_cache))]  # oldest first
+    return url
+
+
+def _image_messages(image_url: str, detail: str):
+    return [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": PROMPT_IMAGE},
+                {
+                    "type": "image_url",
+                    "image_url": {"url": image_url, "detail": detail},
+                },
+            ],
+        }
+    ]
+
+
+def send_to_openai(client, image_url: str, detail: str = DETAIL):
+    """Send an image URL to GPT‑4o Vision and yield the JSON table reply as it streams in."""
+    stream = client.chat.completions.create(
         model=MODEL,
-        messages=[
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": PROMPT_IMAGE},
-                    {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{b64}"}},
-                ],
-            }
-        ],
+        messages=_image_messages(image_url, detail),
+        response_format=RESPONSE_FORMAT,
+        stream=True,
+    )
+    refusal = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        if getattr(delta, "refusal", None):
+            refusal.append(delta.refusal)
+        if delta.content:
+            yield delta.content
+    if refusal:
+        raise ValueError(f"The model refused to extract the table: {''.join(refusal)}")
+
+
+async def send_to_openai_async(client, image_url: str, detail: str = DETAIL) -> str:
+    """Non-streaming async variant of send_to_openai for an openai.AsyncOpenAI client."""
+    resp = await client.chat.completions.create(
+        model=MODEL, messages=_image_messages(image_url, detail), response_format=RESPONSE_FORMAT
     )
-    return resp.choices[0].message.content.strip()
+    msg = resp.choices[0].message
+    if getattr(msg, "refusal", None):
+        raise ValueError(f"The model refused to extract the table: {msg.refusal}")
+    if msg.content is None:
+        raise ValueError("The model returned an empty response.")
+    return msg.content.strip()
 
-# --------------------------- CSV helpers ---------------------------
+# --------------------------- cache helpers ---------------------------
 
-def parse_csv(csv_text: str):
-    lines = []
-    for line in csv_text.splitlines():
-        line = line.strip()
-        if not line or line.startswith("```"):
-            continue
-        lines.append(line)
-    return [row for row in csv.reader(lines) if any(cell.strip() for cell in row)]
+def _content_hash(image_bytes: bytes) -> str:
+    return hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+
+
+def _cache_key(image_hash: str, detail: str) -> str:
+    """Hash the image together with the settings that shape the response."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(MODEL.encode())
+    h.update(PROMPT_IMAGE.encode())
+    h.update(detail.encode())
+    h.update(image_hash.encode())
+    return h.hexdigest()
 
 
-def save_and_copy(rows, out_dir):
+def _cache_get(key):
+    path = os.path.join(_cache_dir, f"{key}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        os.utime(path)  # mark as recently used
+    except OSError:
+        return None
+    return text
+
+
+def _cache_put(key, text):
+    try:
+        os.makedirs(_cache_dir, exist_ok=True)
+        with open(os.path.join(_cache_dir, f"{key}.json"), "w", encoding="utf-8") as f:
+            f.write(text)
+        entries = [e for e in os.scandir(_cache_dir) if e.is_file()]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        for e in entries[_cache_max:]:
+            os.remove(e.path)
+    except OSError:
+        pass  # caching is best-effort
+
+# --------------------------- reply helpers ---------------------------
+
+def _table_rows(obj):
+    try:
+        return [obj["headers"], *obj["rows"]]
+    except (KeyError, TypeError):
+        raise ValueError("Model response is not a table object.") from None
+
+
+# stream scanning patterns – compiled once, matched at an offset into the buffer
+_HEADERS_START = re.compile(r'"headers"\s*:\s*(?=\[)')
+_ROWS_START = re.compile(r'"rows"\s*:\s*\[')
+_ROW_GAP = re.compile(r"[\s,]*")
+
+
+class TableStreamParser:
+    """Incremental parser for the streamed {"headers": [...], "rows": [[...], ...]} reply.
+
+    feed() returns the header row and each data row as soon as its JSON array is complete;
+    close() parses the whole reply and returns whatever the incremental pass missed.
+    Consumed text is dropped, so each piece of the reply is scanned a bounded number of times.
+    """
+
+    _decoder = json.JSONDecoder()
+    _KEY_OVERLAP = 64  # tail kept while waiting for a key that may be split across pieces
+
+    def __init__(self):
+        self._buf = ""  # unconsumed tail of the reply
+        self._pos = 0  # next unread offset in _buf
+        self._scan = 0  # the pending array has no closing "]" before this offset
+        self._state = "headers"  # -> "header" -> "rows" -> "row" -> "done"
+        self._emitted = 0
+
+    def feed(self, text: str):
+        if self._state == "done":
+            return []
+        self._buf = self._buf[self._pos:] + text
+        self._scan = max(0, self._scan - self._pos)
+        self._pos = 0
+        out = []
+        while (row := self._next()) is not None:
+            out.append(row)
+        self._emitted += len(out)
+        return out
+
+    def close(self, reply: str):
+        """Parse the complete reply text and return the rows feed() has not returned."""
+        return parse_table(reply)[self._emitted:]
+
+    def _next(self):
+        buf = self._buf
+        if self._state in ("headers", "rows"):
+            pattern = _HEADERS_START if self._state == "headers" else _ROWS_START
+            m = pattern.search(buf, self._pos)
+            if not m:
+                self._pos = max(self._pos, len(buf) - self._KEY_OVERLAP)
+                return None
+            self._pos = self._scan = m.end()
+            self._state = "header" if self._state == "headers" else "row"
+        if self._state == "row":
+            self._pos = _ROW_GAP.match(buf, self._pos).end()
+            self._scan = max(self._scan, self._pos)
+            if buf.startswith("]", self._pos):
+                self._state = "done"
+                return None
+        if self._state in ("header", "row") and self._pos < len(buf):
+            return self._decode()
+        return None
+
+    def _decode(self):
+        buf = self._buf
+        end_bracket = buf.find("]", self._scan)
+        if end_bracket < 0:
+            self._scan = len(buf)
+            return None  # array not complete yet
+        try:
+            value, end = self._decoder.raw_decode(buf, self._pos)
+        except json.JSONDecodeError:
+            self._scan = end_bracket + 1  # that "]" was inside a cell string
+            return None
+        self._pos = self._scan = end
+        self._state = "rows" if self._state == "header" else "row"
+        return value
+
+
+def parse_table(reply: str):
+    """Parse a complete reply into a list of rows, header row first."""
+    try:
+        return _table_rows(json.loads(reply))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Model response is not valid JSON: {e}") from None
+
+# --------------------------- CSV helpers ---------------------------
+
+def save(rows, out_dir):
+    """Write results.csv into out_dir; return its path and the CSV text."""
     out_path = os.path.join(out_dir, "results.csv")
+    buf = StringIO()
+    csv.writer(buf).writerows(rows)
+    text = buf.getvalue()
     with open(out_path, "w", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerows(rows)
+        f.write(text)
+    return out_path, text
+
+
+def post_save(out_path, text):
+    """Copy the CSV to the clipboard and open the file – run from the Tk thread."""
     if pyperclip:
         try:
-            pyperclip.copy("\n".join([",".join(r) for r in rows]))
+            pyperclip.copy(text)
         except Exception:
             pass
     try:
         os.startfile(out_path)
     except Exception:
         pass
-    return out_path
 
 # --------------------------- UI helpers ---------------------------
 
@@ -119,31 +388,80 @@ def choose_headers(root, headers, preview_rows):
 
 # --------------------------- main logic ---------------------------
 
-def run_extraction(app, img_path):
-    """Background worker thread."""
+def _ask_columns(app, headers, preview_rows):
+    """Open the column picker on the Tk thread; the choice is put on the returned queue."""
+    answer = queue.Queue(maxsize=1)
+    app.root.after(0, lambda: answer.put(choose_headers(app.root, headers, preview_rows)))
+    return answer
+
+
+def _start_table(app, headers, selected):
+    """Set up the result table for the chosen columns and return their indices."""
+    if not selected:
+        raise ValueError("No columns selected.")
+    app.root.after(0, app.show_columns, selected)
+    sel = set(selected)
+    return [i for i, h in enumerate(headers) if h in sel]
+
+
+def _filter_rows(rows, idx):
+    """Keep only the columns at idx; short rows are padded with empty cells."""
+    width = max(idx) + 1
+    pad = ("",) * width
+    rows = [row if len(row) >= width else (*row, *pad) for row in rows]
+    get = operator.itemgetter(*idx)
+    if len(idx) == 1:
+        return [[get(row)] for row in rows]
+    return [list(get(row)) for row in rows]
+
+
+def run_extraction(app, img_path, detail=DETAIL):
+    """Background worker thread – rows are shown while the reply is still streaming."""
     try:
         with open(img_path, "rb") as f:
             bytes_ = f.read()
-        csv_raw = send_to_openai(bytes_)
-        rows = parse_csv(csv_raw)
+        image_hash = _content_hash(bytes_)
+        key = _cache_key(image_hash, detail)
+        cached = _cache_get(key)
+        if cached is None:
+            pieces = send_to_openai(app.client, _image_url(image_hash, img_path), detail)
+            rows = []
+        else:
+            pieces = []  # nothing to stream – the whole reply is at hand
+            rows = parse_table(cached)
+
+        parser = TableStreamParser()
+        raw = []
+        answer = None  # queue holding the column choice once the picker is open
+        idx = None  # indices of the chosen columns once the user has answered
+        shown = 1  # rows[shown:] are not in the table yet (rows[0] is the header)
+        for piece in pieces:
+            raw.append(piece)
+            rows.extend(parser.feed(piece))
+            if answer is None and len(rows) >= 6:
+                answer = _ask_columns(app, rows[0], rows[1:6])
+            if idx is None and answer is not None and not answer.empty():
+                idx = _start_table(app, rows[0], answer.get())
+            if idx is not None and len(rows) > shown:
+                app.root.after(0, app.append_rows, _filter_rows(rows[shown:], idx))
+                shown = len(rows)
+        if cached is None:
+            reply = "".join(raw)
+            rows.extend(parser.close(reply))
+            _cache_put(key, reply.strip())
+
         if not rows:
             raise ValueError("No rows parsed – model response seems empty or malformed.")
-        headers = rows[0]
-        preview_rows = rows[1:6]
-        selected = choose_headers(app.root, headers, preview_rows)
-        if not selected:
-            raise ValueError("No columns selected.")
-        idx = [i for i, h in enumerate(headers) if h in selected]
-        filtered = [[row[i] if i < len(row) else "" for i in idx] for row in rows]
-        save_path = save_and_copy(filtered, os.path.dirname(img_path))
-        # update table
-        app.table.config(columns=selected)
-        for c in selected:
-            app.table.heading(c, text=c)
-            app.table.column(c, width=120)
-        for r in filtered[1:]:
-            app.table.insert("", "end", values=r)
+        if answer is None:
+            answer = _ask_columns(app, rows[0], rows[1:6])
+        if idx is None:
+            idx = _start_table(app, rows[0], answer.get())
+        filtered = _filter_rows(rows, idx)
+        app.root.after(0, app.append_rows, filtered[shown:])
+        save_path, text = save(filtered, os.path.dirname(img_path))
         app.set_status(f"Done – saved to {save_path}")
+        # queued behind the table inserts so the table fills before the file opens
+        app.root.after(0, post_save, save_path, text)
     except Exception as e:
         app.set_status("Error – see dialog")
         messagebox.showerror("Extraction failed", str(e))
@@ -151,6 +469,84 @@ def run_extraction(app, img_path):
         app.progress.stop()
         app.progress.place_forget()
 
+
+def _retry_delay(err, attempt):
+    """Seconds to wait before retrying – the server's Retry-After if given, else backoff."""
+    response = getattr(err, "response", None)
+    if response is not None:
+        try:
+            return min(float(response.headers["retry-after"]), BATCH_MAX_DELAY)
+        except (KeyError, ValueError):
+            pass  # missing, or an HTTP date rather than seconds
+    return 2 ** attempt + random.random()
+
+
+async def _call(client, sem, image_url, detail):
+    """Semaphore-gated API call, retried with backoff on 429s, 5xx and connection errors."""
+    async with sem:
+        for attempt in range(BATCH_RETRIES):
+            try:
+                return await send_to_openai_async(client, image_url, detail)
+            except (
+                openai.RateLimitError,
+                openai.InternalServerError,
+                openai.APIConnectionError,  # includes APITimeoutError
+            ) as e:
+                if attempt == BATCH_RETRIES - 1:
+                    raise
+                await asyncio.sleep(_retry_delay(e, attempt))
+
+
+async def _extract_one(client, sem, img_path, detail):
+    """Extract one image of a batch and save it as <image file name>.csv next to it."""
+    with open(img_path, "rb") as f:
+        bytes_ = f.read()
+    image_hash = _content_hash(bytes_)
+    key = _cache_key(image_hash, detail)
+    reply = _cache_get(key)
+    if reply is None:
+        image_url = await asyncio.to_thread(_image_url, image_hash, img_path)
+        reply = await _call(client, sem, image_url, detail)
+        rows = parse_table(reply)
+        _cache_put(key, reply)  # only replies that parsed are worth keeping
+    else:
+        rows = parse_table(reply)
+    if not rows:
+        raise ValueError("No rows parsed – model response seems empty or malformed.")
+    out_path = img_path + ".csv"  # keep the extension so scan.png and scan.jpg don't collide
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+    return out_path
+
+
+async def _batch(client, sem, paths, detail):
+    return await asyncio.gather(
+        *(_extract_one(client, sem, p, detail) for p in paths), return_exceptions=True
+    )
+
+
+async def run_batch(app, paths, detail=DETAIL):
+    """Batch worker – runs on the app's asyncio loop, reports back via root.after."""
+    # one semaphore for all batches, so overlapping batches share the concurrency limit
+    if app.batch_sem is None:
+        app.batch_sem = asyncio.Semaphore(BATCH_CONCURRENCY)
+    app.batches_running += 1
+    try:
+        results = await _batch(app.async_client, app.batch_sem, paths, detail)
+        failed = [(p, r) for p, r in zip(paths, results) if isinstance(r, Exception)]
+        app.root.after(0, app.set_status, f"Done – {len(paths) - len(failed)} of {len(paths)} tables saved")
+        if failed:
+            details = "\n".join(f"{os.path.basename(p)}: {e}" for p, e in failed)
+            app.root.after(0, messagebox.showerror, "Batch extraction", details)
+    except Exception as e:
+        app.root.after(0, app.set_status, "Error – see dialog")
+        app.root.after(0, messagebox.showerror, "Batch extraction failed", str(e))
+    finally:
+        app.batches_running -= 1
+        if not app.batches_running:  # keep the bar while another batch is still going
+            app.root.after(0, app.progress.stop)
+            app.root.after(0, app.progress.pack_forget)
+
 # --------------------------- App class ---------------------------
 
 class ExtractorApp:
@@ -158,6 +554,15 @@ class ExtractorApp:
         self.root = tk.Tk()
         self.root.title("Extractor")
         self.root.geometry("640x520")
+        # clients are created once so their connection pools are reused across runs
+        self.client = openai.OpenAI()
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        # retries are done by _call, so the SDK's own must not multiply them
+        self.async_client = openai.AsyncOpenAI(max_retries=0, timeout=BATCH_TIMEOUT)
+        # batch state, only touched on self.loop
+        self.batch_sem = None
+        self.batches_running = 0
         self._build_style()
         self._build_ui()
 
@@ -181,10 +586,15 @@ class ExtractorApp:
         self.thumb_lbl.pack(pady=5)
 
         # action buttons
-        frm_act = ttk.Frame(self.root, padding=(10, 5))
+        self.frm_act = frm_act = ttk.Frame(self.root, padding=(10, 5))
         frm_act.pack()
         ttk.Button(frm_act, text="Extract", command=self._on_extract).pack(side="left", padx=5)
+        ttk.Button(frm_act, text="Batch extract folder", command=self._on_batch).pack(side="left", padx=5)
         ttk.Button(frm_act, text="Exit", command=self.root.quit).pack(side="left")
+        self.high_detail_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frm_act, text="High-detail mode", variable=self.high_detail_var).pack(
+            side="left", padx=(10, 0)
+        )
 
         # table view
         self.table = ttk.Treeview(self.root, show="headings")
@@ -201,6 +611,29 @@ class ExtractorApp:
     def set_status(self, msg):
         self.status_var.set(msg)
 
+    def show_columns(self, columns):
+        self.table.config(columns=columns)
+        for c in columns:
+            self.table.heading(c, text=c)
+            self.table.column(c, width=120)
+
+    def append_rows(self, rows):
+        if len(rows) < TABLE_DETACH_ROWS:
+            for r in rows:
+                self.table.insert("", "end", values=r)
+            return
+        # unmap the table so Tk doesn't redo its layout while we insert
+        self.table.pack_forget()
+        try:
+            insert = self.table.insert
+            for r in rows:
+                insert("", "end", values=r)
+        finally:
+            self.table.pack(fill="both", expand=True, padx=10, pady=10, after=self.frm_act)
+
+    def _detail(self):
+        return "high" if self.high_detail_var.get() else DETAIL
+
     def _browse(self):
         p = filedialog.askopenfilename(filetypes=[("Image", "*.png;*.jpg;*.jpeg;*.bmp;*.gif")])
         if p:
@@ -210,7 +643,7 @@ class ExtractorApp:
     def _show_thumbnail(self, path):
         global _thumbnail_ref
         try:
-            img = Image.open(path)
+            img = _load_image(path).copy()
             img.thumbnail((200, 200))
             _thumbnail_ref = ImageTk.PhotoImage(img)
             self.thumb_lbl.configure(image=_thumbnail_ref)
@@ -227,7 +660,25 @@ class ExtractorApp:
         # show progress bar
         self.progress.pack(fill="x", padx=10)
         self.progress.start(12)
-        threading.Thread(target=run_extraction, args=(self, path), daemon=True).start()
+        threading.Thread(
+            target=run_extraction, args=(self, path, self._detail()), daemon=True
+        ).start()
+
+    def _on_batch(self):
+        folder = filedialog.askdirectory()
+        if not folder:
+            return
+        paths = [
+            os.path.join(folder, n) for n in sorted(os.listdir(folder))
+            if n.lower().endswith(IMAGE_EXTS)
+        ]
+        if not paths:
+            messagebox.showerror("No images", "The chosen folder contains no image files.")
+            return
+        self.set_status(f"Extracting {len(paths)} images …")
+        self.progress.pack(fill="x", padx=10)
+        self.progress.start(12)
+        asyncio.run_coroutine_threadsafe(run_batch(self, paths, self._detail()), self.loop)
 
 # --------------------------- run ---------------------------
 if __name__ == "__main__":